@@ -7,11 +7,18 @@ Test results are written to .out and .err files alongside the code example,
 making it easy to track results in version control.
 """
 
+import asyncio
 import fnmatch
+import io
+import json
 import os
 import random
 import re
 import string
+from collections import defaultdict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -19,16 +26,31 @@ import jinja2
 import typer
 from rich.console import Console
 from rich.table import Table
+from rich.text import Text
 
 from .models.base import DocumentCategoryEnum
 from .output import format_output
-from .utils import execute_script_content, find_files_by_schema, load_data_file, render_template_file
+from .utils import (
+    execute_script_content,
+    find_files_by_schema,
+    iter_files_by_schema,
+    load_data_file,
+    render_template_file,
+    write_env_file,
+)
 
 app = typer.Typer(help="List and run code examples locally with upstream credentials")
 console = Console()
 
 _jinja_env = jinja2.Environment()
 
+
+@lru_cache(maxsize=512)
+def _compile_string_template(source: str) -> jinja2.Template:
+    """Compile a template string once; the same values are expanded per example."""
+    return _jinja_env.from_string(source)
+
+
 # Fixed test code reused across a single run so all templates resolve consistently
 _test_enrollment_code: str | None = None
 
@@ -61,7 +83,7 @@ def expand_template_strings(
     for key, value in data.items():
         if isinstance(value, str) and ("{{" in value or "{%" in value):
             try:
-                template = _jinja_env.from_string(value)
+                template = _compile_string_template(value)
                 value = template.render(**ctx)
             except jinja2.TemplateError:
                 pass
@@ -82,23 +104,37 @@ def extract_service_directory_name(listing_file: Path) -> str | None:
     Returns:
         Service directory name or None if not found
     """
+    return _classify_listing(listing_file)[1]
+
+
+@lru_cache(maxsize=1024)
+def _classify_listing(listing_file: Path) -> tuple[str, str | None]:
+    """Return ``(provider_name, service_dir)`` for a listing file in one pass.
+
+    The provider is the directory immediately before "services" and the
+    service directory the one immediately after it. Memoized, since a listing
+    is classified by the service filter, the provider grouping, and again
+    when its examples are extracted.
+    """
     parts = listing_file.parts
     try:
         services_idx = parts.index("services")
-        # Service directory is immediately after "services"
-        if services_idx + 1 < len(parts):
-            return parts[services_idx + 1]
-    except (ValueError, IndexError):
-        pass
-    return None
+    except ValueError:
+        return "unknown", None
+    prov_name = parts[services_idx - 1] if services_idx > 0 else "unknown"
+    service_dir = parts[services_idx + 1] if services_idx + 1 < len(parts) else None
+    return prov_name, service_dir
 
 
-def extract_code_examples_from_listing(listing_data: dict[str, Any], listing_file: Path) -> list[dict[str, Any]]:
+def extract_code_examples_from_listing(
+    listing_data: dict[str, Any], listing_file: Path, service_dir: str | None = None
+) -> list[dict[str, Any]]:
     """Extract code example and connectivity test documents from a listing file.
 
     Args:
         listing_data: Parsed listing data (documents is a dict keyed by title)
         listing_file: Path to the listing file for resolving relative paths
+        service_dir: Service directory name, if already known (taken from the path otherwise)
 
     Returns:
         List of code example/test documents with resolved file paths
@@ -106,7 +142,7 @@ def extract_code_examples_from_listing(listing_data: dict[str, Any], listing_fil
     code_examples = []
 
     # Get service name from directory structure
-    service_name = extract_service_directory_name(listing_file) or "unknown"
+    service_name = (service_dir or extract_service_directory_name(listing_file)) or "unknown"
 
     # Categories that are testable (executable code)
     testable_categories = {
@@ -135,8 +171,8 @@ def extract_code_examples_from_listing(listing_data: dict[str, Any], listing_fil
             # Resolve file path relative to listing file
             file_path = doc.get("file_path")
             if file_path:
-                # Resolve relative path
-                absolute_path = (listing_file.parent / file_path).resolve()
+                # Resolve relative path (lexically; no symlink resolution or stat needed)
+                absolute_path = Path(os.path.normpath(os.path.join(listing_file.parent, file_path)))
 
                 code_example = {
                     "service_name": service_name,
@@ -169,7 +205,7 @@ def extract_upstream_interfaces_from_offering(
         Dict keyed by interface name, or empty dict if not found.
     """
     try:
-        offering_results = find_files_by_schema(listing_file.parent, "offering_v1")
+        offering_results = find_files_by_schema(listing_file.parent, "offering_v1", recursive=False)
         if not offering_results:
             return {}
         _file_path, _format, offering_data = offering_results[0]
@@ -183,6 +219,7 @@ def discover_code_examples(
     *,
     provider_name: str | None = None,
     service_patterns: list[str] | None = None,
+    test_file: str | None = None,
 ) -> list[tuple[dict[str, Any], str]]:
     """Discover code examples by scanning listing files.
 
@@ -196,117 +233,157 @@ def discover_code_examples(
         provider_name: Only include examples from this provider (exact match).
         service_patterns: Glob patterns for service directory names
             (supports wildcards via fnmatch). Pass a literal name for exact match.
+        test_file: Only include examples whose file path ends with this string.
 
     Returns:
         List of (code_example_dict, provider_name) tuples.
     """
-    listing_results = find_files_by_schema(data_dir, "listing_v1")
+    # Providers live in top-level directories, so a provider filter only needs
+    # to scan that provider's subtree (fall back to the whole data dir when the
+    # layout differs, e.g. data_dir is itself a provider directory)
+    scan_dir = data_dir
+    if provider_name and (data_dir / provider_name).is_dir():
+        scan_dir = data_dir / provider_name
+
+    # Translate all service patterns into one regex up front so each listing
+    # is matched once instead of once per pattern
+    service_re = (
+        re.compile("|".join(f"(?:{fnmatch.translate(os.path.normcase(p))})" for p in service_patterns))
+        if service_patterns
+        else None
+    )
 
-    results: list[tuple[dict[str, Any], str]] = []
+    # Filter by service patterns on the path, before any listing is parsed
+    path_filter: Callable[[Path], bool] | None = None
+    if service_re is not None:
+        selected_re = service_re
+
+        def _in_selected_service(listing_file: Path) -> bool:
+            service_dir = _classify_listing(listing_file)[1]
+            return service_dir is not None and selected_re.match(os.path.normcase(service_dir)) is not None
+
+        path_filter = _in_selected_service
 
+    listing_results = iter_files_by_schema(scan_dir, "listing_v1", path_filter=path_filter)
+
+    # Group listings by provider (taken from the directory structure) so a
+    # provider filter only visits that provider's listings
+    listings_by_provider: dict[str, list[tuple[Path, str | None, dict[str, Any]]]] = defaultdict(list)
     for listing_file, _format, listing_data in listing_results:
-        # Determine provider from directory structure
-        parts = listing_file.parts
-        prov_name = "unknown"
-        try:
-            services_idx = parts.index("services")
-            if services_idx > 0:
-                prov_name = parts[services_idx - 1]
-        except (ValueError, IndexError):
-            pass
-
-        # Filter by provider
-        if provider_name and prov_name != provider_name:
-            continue
+        prov_name, service_dir = _classify_listing(listing_file)
+        listings_by_provider[prov_name].append((listing_file, service_dir, listing_data))
 
-        # Filter by service patterns
-        if service_patterns:
-            service_dir = extract_service_directory_name(listing_file)
-            if not service_dir:
-                continue
-            if not any(fnmatch.fnmatch(service_dir, p) for p in service_patterns):
+    if provider_name:
+        selected = [(provider_name, listings_by_provider.get(provider_name, []))]
+    else:
+        selected = list(listings_by_provider.items())
+
+    results: list[tuple[dict[str, Any], str]] = []
+
+    for prov_name, provider_listings in selected:
+        for listing_file, service_dir, listing_data in provider_listings:
+            # Only listings with testable documents need their offering loaded
+            examples = extract_code_examples_from_listing(listing_data, listing_file, service_dir)
+            if test_file:
+                examples = [e for e in examples if e["file_path"].endswith(test_file)]
+            if not examples:
                 continue
 
-        # Load upstream interfaces from offering (cross-product with documents)
-        upstream_interfaces = extract_upstream_interfaces_from_offering(listing_file)
-
-        # For byok services, ops_testing_parameters provides upstream credentials
-        service_options = listing_data.get("service_options", {}) or {}
-        default_params = service_options.get("ops_testing_parameters", {}) or {}
-
-        if not upstream_interfaces and default_params:
-            # No upstream interfaces defined — create one from ops_testing_parameters
-            upstream_interfaces = {"default": dict(default_params)}
-        elif upstream_interfaces and default_params:
-            # Override api_key/base_url with ops_testing_parameters
-            for _name, iface_data in upstream_interfaces.items():
-                for field in ("api_key", "base_url"):
-                    if field in default_params:
-                        iface_data[field] = default_params[field]
-
-        # upstream_access_config is protocol-specific (HTTP, S3, SMTP, etc.)
-        # — no structural validation here; the gateway handles interpretation.
-
-        # Extract code examples × upstream interfaces
-        for example in extract_code_examples_from_listing(listing_data, listing_file):
-            if upstream_interfaces:
-                for iface_name, iface_data in upstream_interfaces.items():
-                    ex = {
-                        **example,
-                        "upstream_interface_name": iface_name,
-                        "upstream_interface": iface_data,
-                    }
-                    results.append((ex, prov_name))
-            else:
-                example["upstream_interface_name"] = "default"
-                example["upstream_interface"] = {}
-                results.append((example, prov_name))
+            # Load upstream interfaces from offering (cross-product with documents)
+            upstream_interfaces = extract_upstream_interfaces_from_offering(listing_file)
+
+            # For byok services, ops_testing_parameters provides upstream credentials
+            service_options = listing_data.get("service_options", {}) or {}
+            default_params = service_options.get("ops_testing_parameters", {}) or {}
+
+            if not upstream_interfaces and default_params:
+                # No upstream interfaces defined — create one from ops_testing_parameters
+                upstream_interfaces = {"default": dict(default_params)}
+            elif upstream_interfaces and default_params:
+                # Override api_key/base_url with ops_testing_parameters
+                for _name, iface_data in upstream_interfaces.items():
+                    for field in ("api_key", "base_url"):
+                        if field in default_params:
+                            iface_data[field] = default_params[field]
+
+            # upstream_access_config is protocol-specific (HTTP, S3, SMTP, etc.)
+            # — no structural validation here; the gateway handles interpretation.
+
+            # Extract code examples × upstream interfaces
+            for example in examples:
+                if upstream_interfaces:
+                    for iface_name, iface_data in upstream_interfaces.items():
+                        ex = {
+                            **example,
+                            "upstream_interface_name": iface_name,
+                            "upstream_interface": iface_data,
+                        }
+                        results.append((ex, prov_name))
+                else:
+                    example["upstream_interface_name"] = "default"
+                    example["upstream_interface"] = {}
+                    results.append((example, prov_name))
 
     return results
 
 
-def load_related_data(listing_file: Path) -> dict[str, Any]:
+def load_related_data(listing_file: Path, out: Console | None = None) -> dict[str, Any]:
     """Load offering, provider, and seller data related to a listing file.
 
     Args:
         listing_file: Path to the listing file
+        out: Console for warnings about missing files (default: the module console)
 
     Returns:
         Dictionary with offering, provider, and seller data (may be empty dicts if not found)
     """
+    result, warnings = _load_related_data_for_dir(listing_file.parent)
+    for warning in warnings:
+        (out or console).print(f"[yellow]Warning: {warning}[/yellow]")
+    return dict(result)
+
+
+@lru_cache(maxsize=256)
+def _load_related_data_for_dir(listing_dir: Path) -> tuple[dict[str, Any], tuple[str, ...]]:
+    """Load related data once per listing directory (shared by all its examples).
+
+    Warnings are returned rather than printed so each caller reports them on its own console.
+    """
     result: dict[str, Any] = {
         "offering": {},
         "provider": {},
         "seller": {},
     }
+    warnings: list[str] = []
 
     try:
         # Find offering file (offering.json in same directory as listing) using find_files_by_schema
-        offering_results = find_files_by_schema(listing_file.parent, "offering_v1")
+        offering_results = find_files_by_schema(listing_dir, "offering_v1", recursive=False)
         if offering_results:
             # Unpack tuple: (file_path, format, data)
             # Data is already loaded by find_files_by_schema
             _file_path, _format, offering_data = offering_results[0]
             result["offering"] = offering_data
         else:
-            console.print(f"[yellow]Warning: No offering_v1 file found in {listing_file.parent}[/yellow]")
+            warnings.append(f"No offering_v1 file found in {listing_dir}")
 
         # Find provider file using find_files_by_schema
         # Structure: data/{provider}/services/{service}/listing.json
-        # Go up to provider directory (2 levels up from listing)
-        provider_dir = listing_file.parent.parent.parent
-        provider_results = find_files_by_schema(provider_dir, "provider_v1")
+        # Go up to provider directory (2 levels up from listing); the provider
+        # file sits directly in it, so there is no need to walk its services
+        provider_dir = listing_dir.parent.parent
+        provider_results = find_files_by_schema(provider_dir, "provider_v1", recursive=False)
         if provider_results:
             # Unpack tuple: (file_path, format, data)
             # Data is already loaded by find_files_by_schema
             _file_path, _format, provider_data = provider_results[0]
             result["provider"] = provider_data
         else:
-            console.print(f"[yellow]Warning: No provider_v1 file found in {provider_dir}[/yellow]")
+            warnings.append(f"No provider_v1 file found in {provider_dir}")
 
         # Find seller file using find_files_by_schema (optional - seller files are not always present)
         # Go up to data directory (3 levels up from listing)
-        data_dir = listing_file.parent.parent.parent.parent
+        data_dir = listing_dir.parent.parent.parent
         seller_results = find_files_by_schema(data_dir, "seller_v1")
         if seller_results:
             # Unpack tuple: (file_path, format, data)
@@ -316,9 +393,9 @@ def load_related_data(listing_file: Path) -> dict[str, Any]:
         # No warning if seller file not found - seller data is optional
 
     except Exception as e:
-        console.print(f"[yellow]Warning: Failed to load related data: {e}[/yellow]")
+        warnings.append(f"Failed to load related data: {e}")
 
-    return result
+    return result, tuple(warnings)
 
 
 _SECRETS_RE = re.compile(
@@ -440,12 +517,22 @@ def load_upstream_access_interface(listing_file: Path) -> dict[str, str] | None:
     return None
 
 
-def execute_code_example(code_example: dict[str, Any], credentials: dict[str, Any]) -> dict[str, Any]:
+def execute_code_example(
+    code_example: dict[str, Any],
+    credentials: dict[str, Any],
+    settle_timeout: float | None = None,
+    base_env: dict[str, str] | None = None,
+    out: Console | None = None,
+) -> dict[str, Any]:
     """Execute a code example script with upstream credentials.
 
     Args:
         code_example: Code example metadata with file_path and listing_data
         credentials: Upstream access config fields (api_key, base_url, host, routing_key, etc.)
+        settle_timeout: Stop the script this many seconds after its expected output
+            appeared and it went quiet (default: wait for it to exit)
+        base_env: Environment the credentials are layered on (default: os.environ)
+        out: Console for warnings while loading related data (default: the module console)
 
     Returns:
         Result dictionary with success, exit_code, stdout, stderr, rendered_content, file_suffix
@@ -471,12 +558,13 @@ def execute_code_example(code_example: dict[str, Any], credentials: dict[str, An
         # Get original file extension
         original_path = Path(file_path)
 
-        # Load related data for template rendering (if needed)
+        # Load related data for template rendering (only .j2 files are rendered,
+        # so plain scripts skip the offering/provider/seller lookups)
         listing_data = code_example.get("listing_data", {})
         listing_file = code_example.get("listing_file")
         related_data = {}
-        if listing_file:
-            related_data = load_related_data(Path(listing_file))
+        if listing_file and original_path.name.endswith(".j2"):
+            related_data = load_related_data(Path(listing_file), out=out)
 
         # Render template if applicable (handles both .j2 and non-.j2 files).
         # local_testing=True so templates can include request parameters that
@@ -534,6 +622,8 @@ def execute_code_example(code_example: dict[str, Any], credentials: dict[str, An
             env_vars=env_vars,
             output_contains=output_contains,
             timeout=30,
+            settle_timeout=settle_timeout,
+            base_env=base_env,
         )
 
         # Map shared result to SDK result format
@@ -549,6 +639,24 @@ def execute_code_example(code_example: dict[str, Any], credentials: dict[str, An
     return result
 
 
+def _execution_key(code_example: dict[str, Any], credentials: dict[str, Any]) -> tuple[str, ...] | None:
+    """Return a key identifying what executing a code example actually runs.
+
+    Two examples with the same key run the same script with the same
+    environment and pass criteria, so one execution can serve both. Templates
+    (.j2) render differently per listing and get no key.
+    """
+    file_path = code_example.get("file_path", "")
+    if not file_path or file_path.endswith(".j2"):
+        return None
+    return (
+        file_path,
+        code_example.get("mime_type", "python"),
+        code_example.get("output_contains") or "",
+        json.dumps(credentials, sort_keys=True, default=str),
+    )
+
+
 def get_output_file_paths(code_example_path: Path, listing_file: Path) -> tuple[Path, Path]:
     """Get the .out and .err file paths for a code example.
 
@@ -592,15 +700,13 @@ def has_passing_output_files(code_example_path: Path, listing_file: Path) -> boo
     out_path, err_path = get_output_file_paths(code_example_path, listing_file)
     status_path = out_path.with_suffix(".status")
 
-    if not (out_path.exists() and err_path.exists() and status_path.exists()):
-        return False
-
-    # Check if status is "pass"
+    # Read the status first: a missing or failing status settles it without
+    # checking for the other two files
     try:
         status = status_path.read_text().strip()
-        return status == "pass"
     except Exception:
         return False
+    return status == "pass" and out_path.exists() and err_path.exists()
 
 
 def save_output_files(
@@ -625,14 +731,9 @@ def save_output_files(
     out_path, err_path = get_output_file_paths(code_example_path, listing_file)
     status_path = out_path.with_suffix(".status")
 
-    with open(out_path, "w", encoding="utf-8") as f:
-        f.write(stdout or "")
-
-    with open(err_path, "w", encoding="utf-8") as f:
-        f.write(stderr or "")
-
-    with open(status_path, "w", encoding="utf-8") as f:
-        f.write("pass" if passed else "fail")
+    out_path.write_text(stdout or "", encoding="utf-8")
+    err_path.write_text(stderr or "", encoding="utf-8")
+    status_path.write_text("pass" if passed else "fail", encoding="utf-8")
 
     return out_path, err_path
 
@@ -713,6 +814,10 @@ def list_code_examples(
         console.print("[yellow]No code examples found.[/yellow]")
         raise typer.Exit(code=0)
 
+    # Example file paths are already absolute and normalized, so relative
+    # paths can be computed lexically against the (normalized) data directory
+    data_dir_str = os.path.normpath(data_dir)
+
     # Build rows as dicts for all output formats
     rows: list[dict[str, str]] = []
     for example, _prov_name in all_code_examples:
@@ -720,20 +825,20 @@ def list_code_examples(
         category = example.get("category", "unknown")
 
         # Get file extension (strip .j2 if present to show actual type)
-        path = Path(file_path)
-        if path.suffix == ".j2":
-            file_ext = Path(path.stem).suffix or "unknown"
-        else:
-            file_ext = path.suffix or "unknown"
+        stem, file_ext = os.path.splitext(file_path)
+        if file_ext == ".j2":
+            file_ext = os.path.splitext(stem)[1]
+        file_ext = file_ext or "unknown"
 
         # Show path relative to data directory
         if file_path != "N/A":
             try:
-                abs_path = Path(file_path).resolve()
-                rel_path = abs_path.relative_to(data_dir.resolve())
-                file_path = str(rel_path)
+                rel_path = os.path.relpath(file_path, data_dir_str)
             except ValueError:
-                file_path = str(file_path)
+                # Different drives on Windows
+                rel_path = os.pardir
+            if rel_path != os.pardir and not rel_path.startswith(os.pardir + os.sep):
+                file_path = rel_path
 
         rows.append(
             {
@@ -845,6 +950,24 @@ def show_test(
                 console.print(stderr[:1000] if len(stderr) > 1000 else stderr)
 
 
+# Summary table columns as (header, style)
+_SUMMARY_COLUMNS = (
+    ("Service", "cyan"),
+    ("Provider", "blue"),
+    ("Example", "white"),
+    ("Interface", "magenta"),
+    ("Status", "green"),
+    ("Exit Code", "white"),
+)
+
+# Summary table cell for each test case status, parsed from markup once
+_STATUS_CELLS = {
+    "passed": Text.from_markup("[green]✓ Pass[/green]"),
+    "skipped": Text.from_markup("[yellow]⊘ Skipped[/yellow]"),
+    "failed": Text.from_markup("[red]✗ Fail[/red]"),
+}
+
+
 @app.command("run")
 def run_local(
     data_dir: Path | None = typer.Argument(
@@ -887,6 +1010,17 @@ def run_local(
         "-x",
         help="Stop testing on first failure",
     ),
+    settle_timeout: float | None = typer.Option(
+        None,
+        "--settle-timeout",
+        help="Stop a script once its expected output has appeared and it has been quiet for this many seconds",
+    ),
+    concurrency: int = typer.Option(
+        1,
+        "--concurrency",
+        "-j",
+        help="Number of test cases to run in parallel",
+    ),
 ):
     """Run code examples locally with upstream API credentials.
 
@@ -926,6 +1060,9 @@ def run_local(
 
         # Stop on first failure
         usvc data test --fail-fast
+
+        # Run 4 test cases in parallel
+        usvc data test -j 4
     """
     # Set data directory
     if data_dir is None:
@@ -957,14 +1094,11 @@ def run_local(
         data_dir,
         provider_name=provider_name,
         service_patterns=service_patterns,
+        test_file=test_file,
     )
 
-    # Filter by test file name if provided
-    if test_file:
-        discovered = [(e, p) for e, p in discovered if e.get("file_path", "").endswith(test_file)]
-
     # Resolve credentials from upstream_interface in each discovered example
-    all_code_examples: list[tuple[dict[str, Any], str, dict[str, str]]] = []
+    all_code_examples: list[tuple[dict[str, Any], str, dict[str, str], dict[str, str]]] = []
     warned_listings: set[str] = set()
 
     for example, prov_name in discovered:
@@ -1009,7 +1143,7 @@ def run_local(
         # Accept credentials if we have base_url, host (SMTP), or access_key (S3)
         if base_url or credentials.get("host") or credentials.get("access_key"):
             credentials.setdefault("api_key", "")
-            all_code_examples.append((example, prov_name, credentials))
+            all_code_examples.append((example, prov_name, credentials, rendered_vars))
         else:
             listing_file_str = str(example.get("listing_file", ""))
             if listing_file_str not in warned_listings:
@@ -1023,86 +1157,112 @@ def run_local(
     console.print(f"[cyan]Found {len(all_code_examples)} test case(s)[/cyan]\n")
 
     # Execute each test case (one entry per document × upstream interface)
-    results = []
-
-    for example, prov_name, credentials in all_code_examples:
+    # Listings sharing a plain script run it once; the result is reused for the rest
+    executed: dict[tuple[str, ...], dict[str, Any]] = {}
+    # Snapshot the environment once; each script layers its credentials on top
+    base_env = dict(os.environ)
+
+    def _run_one(
+        example: dict[str, Any],
+        prov_name: str,
+        credentials: dict[str, Any],
+        enrollment_vars: dict[str, str],
+        out: Console,
+    ) -> dict:
+        """Run a single test case, reporting progress to *out*, and return its results entry.
+
+        Everything the case prints goes to *out*, and its enrollment_vars were
+        rendered up front on the main thread, so parallel cases neither
+        interleave output nor touch the shared test enrollment code.
+        """
         service_name = example["service_name"]
         example_title = example["title"]
         iface_name = example.get("upstream_interface_name", "default")
         example_listing_file = example.get("listing_file")
+        # Build the paths once; they are needed for the skip check and the saved outputs
+        listing_path = Path(example_listing_file) if example_listing_file else None
         code_example_path = Path(example.get("file_path", ""))
 
         label = f"{service_name} - {example_title} [{iface_name}]"
 
         # Check if test previously passed (skip if not forcing)
-        if (
-            not force
-            and example_listing_file
-            and has_passing_output_files(code_example_path, Path(example_listing_file))
-        ):
-            console.print(f"[bold]Testing:[/bold] {label}")
-            console.print("  [yellow]⊘ Skipped[/yellow] (previously passed)")
-            console.print()
-            results.append(
-                {
-                    "service_name": service_name,
-                    "provider": prov_name,
-                    "title": example_title,
-                    "interface": iface_name,
-                    "result": {
-                        "success": True,
-                        "exit_code": None,
-                        "skipped": True,
-                    },
-                }
-            )
-            continue
-
-        console.print(f"[bold]Testing:[/bold] {label}")
-
-        result = execute_code_example(example, credentials)
-        result["skipped"] = False
-
-        results.append(
-            {
+        if not force and listing_path and has_passing_output_files(code_example_path, listing_path):
+            out.print(f"[bold]Testing:[/bold] {label}")
+            out.print("  [yellow]⊘ Skipped[/yellow] (previously passed)")
+            out.print()
+            return {
                 "service_name": service_name,
                 "provider": prov_name,
                 "title": example_title,
                 "interface": iface_name,
-                "result": result,
+                "status": "skipped",
+                "exit_code": "N/A",
+                "result": {
+                    "success": True,
+                    "exit_code": None,
+                    "skipped": True,
+                },
             }
-        )
+
+        out.print(f"[bold]Testing:[/bold] {label}")
+
+        run_key = _execution_key(example, credentials)
+        if run_key is not None and run_key in executed:
+            result = dict(executed[run_key])
+            result["listing_file"] = example_listing_file
+            out.print("  [dim]Reusing result of an identical test run[/dim]")
+        else:
+            result = execute_code_example(
+                example, credentials, settle_timeout=settle_timeout, base_env=base_env, out=out
+            )
+            if run_key is not None:
+                executed[run_key] = result
+        result["skipped"] = False
+
+        entry = {
+            "service_name": service_name,
+            "provider": prov_name,
+            "title": example_title,
+            "interface": iface_name,
+            "status": "passed" if result["success"] else "failed",
+            # Use 'is not None' to properly handle exit_code of 0 (success)
+            "exit_code": str(result["exit_code"]) if result["exit_code"] is not None else "N/A",
+            "result": result,
+        }
+        # Captured output is printed, saved next to the listing, and (on failure) saved as artifacts
+        stdout = result.get("stdout") or ""
+        stderr = result.get("stderr") or ""
 
         if result["success"]:
-            console.print(f"  [green]✓ Success[/green] (exit code: {result['exit_code']})")
-            if verbose and result["stdout"]:
-                console.print(f"  [dim]stdout:[/dim] {result['stdout'][:200]}")
+            out.print(f"  [green]✓ Success[/green] (exit code: {result['exit_code']})")
+            if verbose and stdout:
+                out.print(f"  [dim]stdout:[/dim] {stdout[:200]}")
 
             # Save output to .out, .err, and .status files
-            if example_listing_file:
+            if listing_path:
                 out_path, err_path = save_output_files(
                     code_example_path,
-                    Path(example_listing_file),
-                    result.get("stdout", "") or "",
-                    result.get("stderr", "") or "",
+                    listing_path,
+                    stdout,
+                    stderr,
                     passed=True,
                 )
-                console.print(f"  [dim]Output saved to: {out_path.name}, {err_path.name}[/dim]")
+                out.print(f"  [dim]Output saved to: {out_path.name}, {err_path.name}[/dim]")
         else:
-            console.print(f"  [red]✗ Failed[/red] - {result['error']}")
+            out.print(f"  [red]✗ Failed[/red] - {result['error']}")
             if verbose:
-                if result["stdout"]:
-                    console.print(f"  [dim]stdout:[/dim] {result['stdout'][:200]}")
-                if result["stderr"]:
-                    console.print(f"  [dim]stderr:[/dim] {result['stderr'][:200]}")
+                if stdout:
+                    out.print(f"  [dim]stdout:[/dim] {stdout[:200]}")
+                if stderr:
+                    out.print(f"  [dim]stderr:[/dim] {stderr[:200]}")
 
             # Save output to .out, .err, and .status files next to listing (for skip logic)
-            if example_listing_file:
+            if listing_path:
                 save_output_files(
                     code_example_path,
-                    Path(example_listing_file),
-                    result.get("stdout", "") or "",
-                    result.get("stderr", "") or "",
+                    listing_path,
+                    stdout,
+                    stderr,
                     passed=False,
                 )
 
@@ -1118,94 +1278,124 @@ def run_local(
 
                 # Write failed test script content to current directory (for debugging)
                 try:
-                    with open(failed_filename, "w", encoding="utf-8") as f:
-                        f.write(result["rendered_content"])
-                    console.print(f"  [yellow]→ Test script saved to:[/yellow] {failed_filename}")
+                    Path(failed_filename).write_text(result["rendered_content"], encoding="utf-8")
+                    out.print(f"  [yellow]→ Test script saved to:[/yellow] {failed_filename}")
                 except Exception as e:
-                    console.print(f"  [yellow]⚠ Failed to save test script: {e}[/yellow]")
+                    out.print(f"  [yellow]⚠ Failed to save test script: {e}[/yellow]")
 
                 # Write stdout to .out file
-                stdout = result.get("stdout", "") or ""
                 out_filename = f"{failed_filename}.out"
                 try:
-                    with open(out_filename, "w", encoding="utf-8") as f:
-                        f.write(stdout)
-                    console.print(f"  [yellow]→ stdout saved to:[/yellow] {out_filename}")
+                    Path(out_filename).write_text(stdout, encoding="utf-8")
+                    out.print(f"  [yellow]→ stdout saved to:[/yellow] {out_filename}")
                 except Exception as e:
-                    console.print(f"  [yellow]⚠ Failed to save stdout: {e}[/yellow]")
+                    out.print(f"  [yellow]⚠ Failed to save stdout: {e}[/yellow]")
 
                 # Write stderr to .err file
-                stderr = result.get("stderr", "") or ""
                 err_filename = f"{failed_filename}.err"
                 try:
-                    with open(err_filename, "w", encoding="utf-8") as f:
-                        f.write(stderr)
-                    console.print(f"  [yellow]→ stderr saved to:[/yellow] {err_filename}")
+                    Path(err_filename).write_text(stderr, encoding="utf-8")
+                    out.print(f"  [yellow]→ stderr saved to:[/yellow] {err_filename}")
                 except Exception as e:
-                    console.print(f"  [yellow]⚠ Failed to save stderr: {e}[/yellow]")
+                    out.print(f"  [yellow]⚠ Failed to save stderr: {e}[/yellow]")
 
                 # Write environment variables to .env file
                 env_filename = f"{failed_filename}.env"
                 try:
-                    with open(env_filename, "w", encoding="utf-8") as f:
-                        f.write(f"UNITYSVC_API_KEY={credentials.get('api_key', '')}\n")
-                        f.write(f"SERVICE_BASE_URL={credentials.get('base_url', '')}\n")
-                        # Include service_options.enrollment_vars
-                        listing_so = example.get("listing_data", {}).get("service_options", {}) or {}
-                        for k, v in expand_template_strings(listing_so.get("enrollment_vars", {}) or {}).items():
-                            resolved = resolve_secret_ref(str(v), f"enrollment_vars.{k}")
-                            f.write(f"{k.upper()}={resolved}\n")
-                    console.print(f"  [yellow]→ Environment variables saved to:[/yellow] {env_filename}")
-                    console.print(f"  [dim]  (source this file to reproduce: source {env_filename})[/dim]")
+                    env_file_vars = {
+                        "UNITYSVC_API_KEY": str(credentials.get("api_key", "")),
+                        "SERVICE_BASE_URL": str(credentials.get("base_url", "")),
+                    }
+                    # Include service_options.enrollment_vars
+                    for k, v in enrollment_vars.items():
+                        env_file_vars[k.upper()] = v
+                    write_env_file(env_filename, env_file_vars)
+                    out.print(f"  [yellow]→ Environment variables saved to:[/yellow] {env_filename}")
+                    out.print(f"  [dim]  (source this file to reproduce: source {env_filename})[/dim]")
                 except Exception as e:
-                    console.print(f"  [yellow]⚠ Failed to save environment file: {e}[/yellow]")
+                    out.print(f"  [yellow]⚠ Failed to save environment file: {e}[/yellow]")
 
-            # Stop testing if fail-fast is enabled
-            if fail_fast:
-                console.print()
-                console.print("[yellow]⚠ Stopping tests due to --fail-fast[/yellow]")
-                break
+        out.print()
+        return entry
 
-        console.print()
+    results: list[dict[str, Any]] = []
+    fail_fast_message = "[yellow]⚠ Stopping tests due to --fail-fast[/yellow]"
+
+    if concurrency <= 1:
+        # Sequential mode — print directly to console
+        for example, prov_name, credentials, enrollment_vars in all_code_examples:
+            entry = _run_one(example, prov_name, credentials, enrollment_vars, console)
+            results.append(entry)
+            if fail_fast and entry["status"] == "failed":
+                console.print(fail_fast_message)
+                break
+    else:
+        # Parallel mode — buffer output per test case, flush when done
+        async def _run_all() -> list[dict[str, Any]]:
+            # asyncio.to_thread runs on the loop's default executor, which is
+            # capped at min(32, cpu_count + 4) threads; size it to -j instead
+            asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=concurrency))
+            sem = asyncio.Semaphore(concurrency)
+            stop_all = asyncio.Event()
+            total = len(all_code_examples)
+            completed = 0
+
+            async def _worker(
+                example: dict[str, Any], prov_name: str, credentials: dict[str, Any], enrollment_vars: dict[str, str]
+            ) -> dict | None:
+                nonlocal completed
+                if stop_all.is_set():
+                    return None
+                async with sem:
+                    if stop_all.is_set():
+                        return None
+                    buf = io.StringIO()
+                    buf_console = Console(file=buf, force_terminal=console.is_terminal)
+                    entry = await asyncio.to_thread(
+                        _run_one, example, prov_name, credentials, enrollment_vars, buf_console
+                    )
+                    # Flush buffered output atomically
+                    completed += 1
+                    console.print(buf.getvalue(), end="", highlight=False, markup=False)
+                    console.print(f"[dim]  ({completed}/{total} test cases completed)[/dim]")
+                    if fail_fast and entry["status"] == "failed" and not stop_all.is_set():
+                        stop_all.set()
+                        console.print(fail_fast_message)
+                    return entry
+
+            entries = await asyncio.gather(*(_worker(*case) for case in all_code_examples))
+            return [entry for entry in entries if entry is not None]
+
+        console.print(f"[dim]Running up to {concurrency} test cases in parallel[/dim]\n")
+        results = asyncio.run(_run_all())
 
     # Print summary table
     console.print("\n" + "=" * 70)
     console.print("[bold]Test Results Summary:[/bold]\n")
 
     table = Table(title="Code Example Tests")
-    table.add_column("Service", style="cyan")
-    table.add_column("Provider", style="blue")
-    table.add_column("Example", style="white")
-    table.add_column("Interface", style="magenta")
-    table.add_column("Status", style="green")
-    table.add_column("Exit Code", style="white")
+    for header, style in _SUMMARY_COLUMNS:
+        table.add_column(header, style=style)
 
+    # Count outcomes while filling the table, in a single pass over the results
     total_tests = len(results)
-    skipped = sum(1 for r in results if r["result"].get("skipped", False))
-    passed = sum(1 for r in results if r["result"]["success"] and not r["result"].get("skipped", False))
-    failed = total_tests - passed - skipped
+    counts = dict.fromkeys(_STATUS_CELLS, 0)
 
     for test in results:
-        result = test["result"]
-        if result.get("skipped", False):
-            status = "[yellow]⊘ Skipped[/yellow]"
-        elif result["success"]:
-            status = "[green]✓ Pass[/green]"
-        else:
-            status = "[red]✗ Fail[/red]"
-
-        # Use 'is not None' to properly handle exit_code of 0 (success)
-        exit_code = str(result["exit_code"]) if result["exit_code"] is not None else "N/A"
-
+        counts[test["status"]] += 1
+        # Names and titles come from data files; pass them as Text so they are
+        # neither scanned for markup nor mangled when they contain "[...]"
         table.add_row(
-            test["service_name"],
-            test["provider"],
-            test["title"],
-            test.get("interface", ""),
-            status,
-            exit_code,
+            Text(test["service_name"]),
+            Text(test["provider"]),
+            Text(test["title"]),
+            Text(test.get("interface", "")),
+            _STATUS_CELLS[test["status"]],
+            Text(test["exit_code"]),
         )
 
+    passed, skipped, failed = counts["passed"], counts["skipped"], counts["failed"]
+
     console.print(table)
     console.print(f"\n[green]✓ Passed: {passed}/{total_tests}[/green]")
     if skipped > 0:
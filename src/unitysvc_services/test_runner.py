@@ -4,6 +4,7 @@ import asyncio
 import json
 import os
 from datetime import UTC, datetime
+from pathlib import Path
 from typing import Any
 
 import typer
@@ -598,7 +599,10 @@ def run_test(
     if not service_id and not doc_id and not all_services:
         console.print("[red]Error: Either SERVICE_ID argument, --doc-id, or --all must be provided[/red]")
         raise typer.Exit(code=1)
-    from .utils import execute_script_content
+    from .utils import execute_script_content, write_env_file
+
+    # Snapshot the environment once; each script layers its own variables on top
+    base_env = dict(os.environ)
 
     def _execute_script(
         file_content: str,
@@ -616,7 +620,7 @@ def run_test(
         if resolved_base_url:
             exec_env["SERVICE_BASE_URL"] = resolved_base_url
         # UNITYSVC_API_KEY from caller's environment
-        api_key = os.environ.get("UNITYSVC_API_KEY", "")
+        api_key = base_env.get("UNITYSVC_API_KEY", "")
         if api_key:
             exec_env["UNITYSVC_API_KEY"] = api_key
         # Expose routing_key entries as uppercased env vars
@@ -631,6 +635,7 @@ def run_test(
                 env_vars=exec_env,
                 timeout=timeout,
                 output_contains=output_contains,
+                base_env=base_env,
             )
             return {
                 "exit_code": result.get("exit_code", -1),
@@ -768,28 +773,27 @@ def run_test(
                     base_name = f"failed_{resolved_service_id}_{script_stem}_{safe_iface}"
                     if result.get("file_content"):
                         script_name = f"{base_name}{script_ext}"
-                        with open(script_name, "w") as f:
-                            f.write(result["file_content"])
+                        Path(script_name).write_text(result["file_content"])
                         os.chmod(script_name, 0o755)
                         out.print(f"  [dim]script: {script_name}[/dim]")
                     # Use script_name (with extension) as base for output files
                     # to avoid collisions (e.g., code-example.py vs code-example.js)
                     output_base = f"{base_name}{script_ext}" if script_ext else base_name
                     if result.get("stdout"):
-                        with open(f"{output_base}.out", "w") as f:
-                            f.write(result["stdout"])
+                        Path(f"{output_base}.out").write_text(result["stdout"])
                         out.print(f"  [dim]stdout: {output_base}.out[/dim]")
                     if result.get("stderr"):
-                        with open(f"{output_base}.err", "w") as f:
-                            f.write(result["stderr"])
+                        Path(f"{output_base}.err").write_text(result["stderr"])
                         out.print(f"  [dim]stderr: {output_base}.err[/dim]")
                     env_path = f"{output_base}.env"
-                    with open(env_path, "w") as f:
-                        f.write(f"SERVICE_BASE_URL={resolved_url}\n")
-                        f.write(f"UNITYSVC_API_KEY={os.environ.get('UNITYSVC_API_KEY', '')}\n")
-                        if iface_rk:
-                            for rk_key, rk_val in iface_rk.items():
-                                f.write(f"{rk_key.upper()}={rk_val}\n")
+                    env_file_vars = {
+                        "SERVICE_BASE_URL": resolved_url,
+                        "UNITYSVC_API_KEY": base_env.get("UNITYSVC_API_KEY", ""),
+                    }
+                    if iface_rk:
+                        for rk_key, rk_val in iface_rk.items():
+                            env_file_vars[rk_key.upper()] = str(rk_val)
+                    write_env_file(env_path, env_file_vars)
                     out.print(f"  [dim]   env: {env_path}[/dim]")
 
                 if fail_fast and result["status"] != "success":
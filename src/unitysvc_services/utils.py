@@ -7,17 +7,27 @@ and unitysvc backend, including:
 - Data file loading and merging
 """
 
+import codecs
+import copy
 import hashlib
 import json
 import os
+import selectors
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
 import tomllib
-from functools import lru_cache
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from functools import cache, lru_cache
 from pathlib import Path
 from typing import Any
 
 import json5
 import tomli_w
 from jinja2 import Environment as JinjaEnvironment
+from jinja2 import Template
 
 # =============================================================================
 # Content Hashing and File Utilities
@@ -177,6 +187,20 @@ def deep_merge_dicts(base: dict[str, Any], override: dict[str, Any]) -> dict[str
     return result
 
 
+def _load_json_file(file_path: Path) -> Any:
+    """Load a JSON data file, accepting JSON5 syntax (comments, trailing commas).
+
+    Most data files are plain JSON, so the C-accelerated ``json`` parser is
+    tried first; ``json5`` (pure Python and much slower) is only used for
+    files that need it.
+    """
+    text = file_path.read_text(encoding="utf-8")
+    try:
+        return json.loads(text)
+    except ValueError:
+        return json5.loads(text)
+
+
 def load_data_file(file_path: Path, *, skip_override: bool = False) -> tuple[dict[str, Any], str]:
     """
     Load a data file (JSON or TOML) and return (data, format).
@@ -205,8 +229,7 @@ def load_data_file(file_path: Path, *, skip_override: bool = False) -> tuple[dic
     """
     # Load the base file
     if file_path.suffix == ".json":
-        with open(file_path, encoding="utf-8") as f:
-            data = json5.load(f)
+        data = _load_json_file(file_path)
         file_format = "json"
     elif file_path.suffix == ".toml":
         with open(file_path, "rb") as f:
@@ -224,8 +247,7 @@ def load_data_file(file_path: Path, *, skip_override: bool = False) -> tuple[dic
         if override_path.exists():
             # Load the override file (same format as base file)
             if override_path.suffix == ".json":
-                with open(override_path, encoding="utf-8") as f:
-                    override_data = json5.load(f)
+                override_data = _load_json_file(override_path)
             elif override_path.suffix == ".toml":
                 with open(override_path, "rb") as f:
                     override_data = tomllib.load(f)
@@ -252,16 +274,21 @@ def write_data_file(file_path: Path, data: dict[str, Any], format: str) -> None:
     Raises:
         ValueError: If format is not supported
     """
+    created = not file_path.exists()
+
+    # Serialize in memory and write once; json.dump would issue a write per token
     if format == "json":
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, sort_keys=True)
-            f.write("\n")
+        file_path.write_text(json.dumps(data, indent=2, sort_keys=True) + "\n", encoding="utf-8")
     elif format == "toml":
-        with open(file_path, "wb") as f:
-            tomli_w.dump(data, f)
+        file_path.write_bytes(tomli_w.dumps(data).encode())
     else:
         raise ValueError(f"Unsupported format: {format}")
 
+    # A new file (e.g. a first override) is missing from cached directory
+    # listings, and a schema change moves a file between schema lookups
+    if created or "schema" in data:
+        invalidate_schema_cache()
+
 
 def write_override_file(
     base_file: Path,
@@ -305,8 +332,7 @@ def write_override_file(
     # Load existing override data if file exists
     if override_path.exists():
         if file_format == "json":
-            with open(override_path, encoding="utf-8") as f:
-                existing_data = json5.load(f)
+            existing_data = _load_json_file(override_path)
         else:
             with open(override_path, "rb") as f:
                 existing_data = tomllib.load(f)
@@ -320,6 +346,7 @@ def write_override_file(
     if delete_if_empty and not merged_data:
         if override_path.exists():
             override_path.unlink()
+            invalidate_schema_cache()
         return None
 
     # Write the override file
@@ -346,28 +373,32 @@ def read_override_file(base_file: Path) -> dict[str, Any]:
 
     # Determine format from base file extension
     if base_file.suffix == ".json":
-        with open(override_path, encoding="utf-8") as f:
-            return json5.load(f)
+        return _load_json_file(override_path)
     elif base_file.suffix == ".toml":
         with open(override_path, "rb") as f:
             return tomllib.load(f)
     else:
         # Try JSON first for unknown formats
         try:
-            with open(override_path, encoding="utf-8") as f:
-                return json5.load(f)
+            return _load_json_file(override_path)
         except Exception:
             return {}
 
 
+# Directories never searched for data files (in addition to hidden ones)
+_SKIPPED_DATA_DIRS = frozenset({"node_modules", "__pycache__"})
+
+
 @lru_cache(maxsize=128)
-def find_data_files(data_dir: Path, extensions: tuple[str, ...] | None = None) -> list[Path]:
+def find_data_files(data_dir: Path, extensions: tuple[str, ...] | None = None, recursive: bool = True) -> list[Path]:
     """
     Find all data files in a directory with specified extensions.
 
     Args:
         data_dir: Directory to search
         extensions: Tuple of extensions to search for (default: ("json", "toml"))
+        recursive: If False, only look at files directly inside data_dir.
+            Hidden directories, node_modules and __pycache__ are never searched.
 
     Returns:
         List of Path objects for matching files
@@ -375,9 +406,23 @@ def find_data_files(data_dir: Path, extensions: tuple[str, ...] | None = None) -
     if extensions is None:
         extensions = ("json", "toml")
 
+    # Walk the tree once for all extensions rather than once per extension,
+    # keeping the result grouped by extension as before
+    files_by_suffix: dict[str, list[Path]] = {f".{ext}": [] for ext in extensions}
+    for dirpath, dirnames, filenames in os.walk(data_dir):
+        # Don't descend into hidden directories (.git, .venv, ...) or package
+        # caches; they never hold data files and can be very large
+        dirnames[:] = [d for d in dirnames if not d.startswith(".") and d not in _SKIPPED_DATA_DIRS]
+        for filename in filenames:
+            matches = files_by_suffix.get(os.path.splitext(filename)[1])
+            if matches is not None:
+                matches.append(Path(dirpath, filename))
+        if not recursive:
+            break
+
     data_files: list[Path] = []
-    for ext in extensions:
-        data_files.extend(data_dir.rglob(f"*.{ext}"))
+    for matches in files_by_suffix.values():
+        data_files.extend(matches)
 
     return data_files
 
@@ -401,9 +446,9 @@ def find_file_by_schema_and_name(
 
     for data_file in data_files:
         try:
-            data, file_format = load_data_file(data_file)
+            data, file_format = _load_data_file_cached(data_file, False)
             if data.get("schema") == schema and data.get(name_field) == name_value:
-                return data_file, file_format, data
+                return data_file, file_format, copy.deepcopy(data)
         except Exception:
             # Skip files that can't be loaded
             continue
@@ -411,57 +456,199 @@ def find_file_by_schema_and_name(
     return None
 
 
-@lru_cache(maxsize=256)
-def find_files_by_schema(
-    data_dir: Path,
-    schema: str,
-    path_filter: str | None = None,
-    field_filter: tuple[tuple[str, Any], ...] | None = None,
-    skip_override: bool = False,
-) -> list[tuple[Path, str, dict[str, Any]]]:
+def invalidate_schema_cache() -> None:
     """
-    Find all data files matching a schema with optional filters.
+    Forget cached directory listings and schema lookups.
 
-    Args:
-        data_dir: Directory to search
-        schema: Schema identifier (e.g., "offering_v1", "listing_v1")
-        path_filter: Optional string that must be in the file path
-        field_filter: Optional tuple of (key, value) pairs to filter by
-        skip_override: If True, skip loading override files (use base data only)
+    ``find_data_files`` and the per-schema lookups of ``find_files_by_schema``
+    are cached for the life of the process. Data files created, deleted, or
+    given a new schema through this module call this automatically; call it
+    after doing so by other means. Other edits to existing files need no
+    invalidation, since parsed contents are cached by the files' stamps.
+    """
+    find_data_files.cache_clear()
+    _schema_candidates.cache_clear()
 
-    Returns:
-        List of tuples (file_path, format, data) for matching files
+
+_FileStamp = tuple[int, int, int, int]
+
+
+def _file_stamp(path: Path) -> _FileStamp | None:
+    """Return ``(mtime_ns, ctime_ns, size, inode)`` for a file, or None if it does not exist.
+
+    The change time and inode catch same-size edits that leave the
+    modification time unchanged (coarse timestamps, or two writes in one tick).
     """
-    data_files = find_data_files(data_dir)
-    matching_files: list[tuple[Path, str, dict[str, Any]]] = []
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_ctime_ns, st.st_size, st.st_ino
+
+
+def _load_data_file_cached(file_path: Path, skip_override: bool) -> tuple[dict[str, Any], str]:
+    """Parse a data file once per process, unless it (or its override) changed.
+
+    ``find_files_by_schema`` is called with several schemas over the same
+    directories (listings, offerings, providers, sellers), so each file would
+    otherwise be parsed once per schema. The cache is unbounded so a full scan
+    of a large tree does not evict its own entries; the stamps keep it fresh.
+    Callers must not mutate the result.
+    """
+    override_stamp = None if skip_override else _file_stamp(file_path.with_stem(f"{file_path.stem}.override"))
+    return _load_data_file_stamped(file_path, skip_override, (_file_stamp(file_path), override_stamp))
 
-    # Convert field_filter tuple back to dict for filtering
-    field_filter_dict = dict(field_filter) if field_filter else None
 
+@cache
+def _load_data_file_stamped(
+    file_path: Path, skip_override: bool, stamp: tuple[_FileStamp | None, _FileStamp | None]
+) -> tuple[dict[str, Any], str]:
+    """Parse a data file; ``stamp`` only keys the cache so edited files are re-read."""
+    return load_data_file(file_path, skip_override=skip_override)
+
+
+def _may_match_schema(data_file: Path, schema: str, skip_override: bool, known_files: set[Path]) -> bool:
+    """Cheaply rule out data files that cannot have the given schema.
+
+    A file whose raw bytes never mention the schema identifier cannot declare
+    it (in any JSON, JSON5, or TOML spelling), so it need not be parsed. Files
+    with an override are always parsed, since the override may set the schema.
+    Overrides share their base file's suffix and directory, so they show up in
+    ``known_files`` (the directory listing) and need no extra stat call.
+    """
+    if not skip_override and data_file.with_stem(f"{data_file.stem}.override") in known_files:
+        return True
+    return _mentions_schema(data_file, schema, _file_stamp(data_file))
+
+
+@cache
+def _mentions_schema(data_file: Path, schema: str, stamp: _FileStamp | None) -> bool:
+    """Check a file's raw bytes for a schema identifier; ``stamp`` keys the cache."""
+    return schema.encode() in data_file.read_bytes()
+
+
+def _iter_schema_matches(
+    data_files: Iterable[Path],
+    schema: str,
+    path_filter: Callable[[Path], bool] | None,
+    field_filter: dict[str, Any] | None,
+    skip_override: bool,
+    known_files: set[Path] | None,
+) -> Iterator[tuple[Path, str, dict[str, Any]]]:
+    """Yield private copies of the data files that match; see ``iter_files_by_schema``.
+
+    ``known_files`` enables the raw-bytes prefilter; pass None when every file
+    is already known to declare the schema.
+    """
     for data_file in data_files:
         try:
             # Apply path filter
-            if path_filter and path_filter not in str(data_file):
+            if path_filter is not None and not path_filter(data_file):
                 continue
 
-            data, file_format = load_data_file(data_file, skip_override=skip_override)
+            if known_files is not None and not _may_match_schema(data_file, schema, skip_override, known_files):
+                continue
+
+            data, file_format = _load_data_file_cached(data_file, skip_override)
 
             # Check schema
             if data.get("schema") != schema:
                 continue
 
             # Apply field filters
-            if field_filter_dict:
-                if not all(data.get(k) == v for k, v in field_filter_dict.items()):
+            if field_filter:
+                if not all(data.get(k) == v for k, v in field_filter.items()):
                     continue
-
-            matching_files.append((data_file, file_format, data))
-
         except Exception:
             # Skip files that can't be loaded
             continue
 
-    return matching_files
+        # Hand out a private copy so callers can modify it freely
+        yield data_file, file_format, copy.deepcopy(data)
+
+
+def iter_files_by_schema(
+    data_dir: Path,
+    schema: str,
+    path_filter: Callable[[Path], bool] | None = None,
+    field_filter: dict[str, Any] | None = None,
+    skip_override: bool = False,
+    recursive: bool = True,
+) -> Iterator[tuple[Path, str, dict[str, Any]]]:
+    """
+    Lazily yield data files matching a schema with optional filters.
+
+    Unlike ``find_files_by_schema``, the path filter is an arbitrary callable
+    and is applied before a file is read, so files it rejects are never parsed.
+
+    Args:
+        data_dir: Directory to search
+        schema: Schema identifier (e.g., "offering_v1", "listing_v1")
+        path_filter: Optional predicate a file path must satisfy
+        field_filter: Optional dict of field values to filter by
+        skip_override: If True, skip loading override files (use base data only)
+        recursive: If False, only look at files directly inside data_dir
+
+    Yields:
+        Tuples (file_path, format, data) for matching files
+    """
+    data_files = find_data_files(data_dir, recursive=recursive)
+    yield from _iter_schema_matches(data_files, schema, path_filter, field_filter, skip_override, set(data_files))
+
+
+@lru_cache(maxsize=256)
+def _schema_candidates(data_dir: Path, schema: str, skip_override: bool, recursive: bool) -> tuple[Path, ...]:
+    """Return the data files under ``data_dir`` that declare ``schema``.
+
+    Only the paths are cached, so repeated lookups (e.g. the provider of every
+    listing) stat just the files they return rather than the whole tree.
+    """
+    data_files = find_data_files(data_dir, recursive=recursive)
+    known_files = set(data_files)
+    return tuple(
+        data_file
+        for data_file, _format, _data in _iter_schema_matches(
+            data_files, schema, None, None, skip_override, known_files
+        )
+    )
+
+
+def find_files_by_schema(
+    data_dir: Path,
+    schema: str,
+    path_filter: str | None = None,
+    field_filter: tuple[tuple[str, Any], ...] | None = None,
+    skip_override: bool = False,
+    recursive: bool = True,
+) -> list[tuple[Path, str, dict[str, Any]]]:
+    """
+    Find all data files matching a schema with optional filters.
+
+    Which files declare the schema is cached per directory; their contents
+    are re-read whenever they change (see ``invalidate_schema_cache``).
+
+    Args:
+        data_dir: Directory to search
+        schema: Schema identifier (e.g., "offering_v1", "listing_v1")
+        path_filter: Optional string that must be in the file path
+        field_filter: Optional tuple of (key, value) pairs to filter by
+        skip_override: If True, skip loading override files (use base data only)
+        recursive: If False, only look at files directly inside data_dir
+
+    Returns:
+        List of tuples (file_path, format, data) for matching files
+    """
+    return list(
+        _iter_schema_matches(
+            _schema_candidates(data_dir, schema, skip_override, recursive),
+            schema,
+            (lambda data_file: path_filter in str(data_file)) if path_filter else None,
+            # Convert field_filter tuple back to dict for filtering
+            dict(field_filter) if field_filter else None,
+            skip_override,
+            None,
+        )
+    )
 
 
 def resolve_provider_name(file_path: Path) -> str | None:
@@ -631,6 +818,18 @@ def convert_convenience_fields_to_documents(
     return data
 
 
+# Shared environment for rendering .j2 files, with a tojson filter so templates
+# can serialise dicts to JSON strings (e.g. ops_testing_parameters)
+_template_env = JinjaEnvironment()
+_template_env.filters["tojson"] = json.dumps
+
+
+@lru_cache(maxsize=256)
+def _compile_template(source: str) -> Template:
+    """Compile template source once; the same file is rendered for every listing and interface."""
+    return _template_env.from_string(source)
+
+
 def render_template_file(
     file_path: Path,
     listing: dict[str, Any] | None = None,
@@ -673,12 +872,7 @@ def render_template_file(
     is_template = file_path.name.endswith(".j2")
 
     if is_template:
-        # Build a Jinja2 environment with a tojson filter so templates can
-        # serialise dicts to JSON strings (e.g. ops_testing_parameters).
-        env = JinjaEnvironment()
-        env.filters["tojson"] = json.dumps
-
-        template = env.from_string(file_content)
+        template = _compile_template(file_content)
         rendered_content = template.render(
             listing=listing or {},
             offering=offering or {},
@@ -698,12 +892,209 @@ def render_template_file(
         return file_content, file_path.name
 
 
+def write_env_file(file_path: Path | str, env_vars: dict[str, str]) -> None:
+    """
+    Write environment variables as a sourceable ``KEY=value`` file.
+
+    The file holds credentials (e.g. UNITYSVC_API_KEY), so it is created with
+    owner-only permissions (0o600), and an existing file is restricted the same way.
+    The content is serialized in memory and written in one buffered call.
+
+    Args:
+        file_path: Path of the .env file to write
+        env_vars: Variables to write, in order
+    """
+    payload = "".join(f"{key}={value}\n" for key, value in env_vars.items()).encode("utf-8")
+    fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    # fdopen takes ownership of fd; its write() retries short writes until done
+    with os.fdopen(fd, "wb") as f:
+        if hasattr(os, "fchmod"):
+            os.fchmod(fd, 0o600)
+        f.write(payload)
+
+
+# Interpreters that can read the script from stdin, mapped to the arguments that
+# make them do so. Only interpreters that read the *entire* script before
+# executing it are listed: bash/sh read stdin incrementally, so commands in the
+# script that consume stdin would swallow the rest of the script.
+_STDIN_SCRIPT_ARGS: dict[str, tuple[str, ...]] = {
+    "python": ("-",),
+    "python3": ("-",),
+    "node": ("-",),
+}
+
+
+def _script_memfd(script: str) -> int | None:
+    """Put a script in an anonymous in-memory file (Linux only).
+
+    The child reads it back through ``/dev/fd/N``, which avoids creating,
+    writing, and unlinking a file on disk. Returns the file descriptor, or
+    None when memfd is not available on this platform.
+    """
+    if not hasattr(os, "memfd_create"):
+        return None
+    try:
+        fd = os.memfd_create("usvc-script")
+    except OSError:
+        return None
+    with open(fd, "w", encoding="utf-8", closefd=False) as f:
+        f.write(script)
+    return fd
+
+
+# Size of each read from a script's stdout/stderr pipe
+_READ_CHUNK_SIZE = 4096
+
+# select() only accepts sockets on Windows, so pipes cannot be multiplexed there
+_PIPES_SELECTABLE = sys.platform != "win32"
+
+
+def _decode_output(data: bytes | bytearray) -> str:
+    """Decode captured output as UTF-8 with universal newlines, as ``text=True`` would."""
+    return data.decode("utf-8", errors="replace").replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _run_with_bounded_output(
+    cmd: list[str],
+    script_input: str | None,
+    env: dict[str, str],
+    timeout: float,
+    max_output_size: int,
+    output_contains: str | None = None,
+    settle_timeout: float | None = None,
+    pass_fds: tuple[int, ...] = (),
+) -> tuple[int, str, str, bool]:
+    """Run a command, keeping only a bounded amount of its output in memory.
+
+    stdout and stderr are drained in small chunks as the process runs. Only
+    the head of stdout and the tail of stderr (``max_output_size`` characters
+    each) are retained, and ``output_contains`` is matched case-insensitively
+    against the stream as it arrives, so a script that prints megabytes does
+    not need megabytes of memory to be checked.
+
+    If ``settle_timeout`` is set, a process that has printed ``output_contains``
+    and then produced no output for ``settle_timeout`` seconds is terminated
+    and reported with exit code 0.
+
+    Where pipes cannot be selected on (Windows), the output is collected with
+    ``communicate()`` and truncated afterwards; ``settle_timeout`` is ignored there.
+
+    Returns:
+        Tuple of (exit code, stdout head, stderr tail, output_contains found)
+
+    Raises:
+        subprocess.TimeoutExpired: If the process does not finish within ``timeout``
+    """
+    process = subprocess.Popen(
+        cmd,
+        stdin=subprocess.PIPE if script_input is not None else subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        env=env,
+        pass_fds=pass_fds,
+    )
+    assert process.stdout is not None and process.stderr is not None
+
+    # UTF-8 needs at most 4 bytes per character
+    max_bytes = max_output_size * 4
+    stdout_head = bytearray()
+    stderr_tail = bytearray()
+
+    needle = output_contains.lower() if output_contains else ""
+    found = not needle
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    window = ""
+
+    try:
+        if not _PIPES_SELECTABLE:
+            stdin_data = script_input.encode("utf-8") if script_input is not None else None
+            out, err = process.communicate(stdin_data, timeout=timeout)
+            found = found or needle in _decode_output(out).lower()
+            return process.returncode, *_bounded_text(out[:max_bytes], err[-max_bytes:], max_output_size), found
+
+        if process.stdin is not None:
+            # Stdin interpreters read the whole script before running it, so
+            # writing it up front cannot deadlock against their output
+            try:
+                process.stdin.write(script_input.encode("utf-8"))  # type: ignore[union-attr]
+            except BrokenPipeError:
+                pass
+            process.stdin.close()
+
+        deadline = time.monotonic() + timeout
+        last_output = time.monotonic()
+        settled = False
+        with selectors.DefaultSelector() as selector:
+            selector.register(process.stdout, selectors.EVENT_READ)
+            selector.register(process.stderr, selectors.EVENT_READ)
+            while selector.get_map():
+                now = time.monotonic()
+                remaining = deadline - now
+                if remaining <= 0:
+                    raise subprocess.TimeoutExpired(cmd, timeout)
+                if needle and found and settle_timeout is not None:
+                    quiet_left = last_output + settle_timeout - now
+                    if quiet_left <= 0:
+                        settled = True
+                        break
+                    remaining = min(remaining, quiet_left)
+                for key, _ in selector.select(remaining):
+                    chunk = os.read(key.fd, _READ_CHUNK_SIZE)
+                    if not chunk:
+                        selector.unregister(key.fileobj)
+                        continue
+                    last_output = time.monotonic()
+                    if key.fileobj is process.stdout:
+                        if len(stdout_head) < max_bytes:
+                            stdout_head += chunk[: max_bytes - len(stdout_head)]
+                        if not found:
+                            # Keep the last len(needle) - 1 characters so a match
+                            # split across two chunks is still seen
+                            window += decoder.decode(chunk).lower()
+                            found = needle in window
+                            window = window[max(len(window) - len(needle) + 1, 0) :]
+                    else:
+                        stderr_tail += chunk
+                        if len(stderr_tail) > max_bytes:
+                            del stderr_tail[:-max_bytes]
+
+        if settled:
+            # Expected output was seen and the script has gone quiet; stop it
+            # instead of waiting for it to exit on its own
+            process.terminate()
+            process.wait(timeout=max(deadline - time.monotonic(), 0))
+            returncode = 0
+        else:
+            returncode = process.wait(timeout=max(deadline - time.monotonic(), 0))
+    except BaseException:
+        process.kill()
+        process.wait()
+        raise
+    finally:
+        process.stdout.close()
+        process.stderr.close()
+
+    return returncode, *_bounded_text(stdout_head, stderr_tail, max_output_size), found
+
+
+def _bounded_text(
+    stdout_head: bytes | bytearray, stderr_tail: bytes | bytearray, max_output_size: int
+) -> tuple[str, str]:
+    """Decode captured output, keeping the head of stdout and the tail of stderr."""
+    stdout = _decode_output(stdout_head)[:max_output_size]
+    # Keep the tail of stderr — the actual error message is at the bottom
+    stderr = _decode_output(stderr_tail)[-max_output_size:]
+    return stdout, stderr
+
+
 def execute_script_content(
     script: str,
     mime_type: str,
     env_vars: dict[str, str],
     output_contains: str | None = None,
     timeout: int = 30,
+    settle_timeout: float | None = None,
+    base_env: Mapping[str, str] | None = None,
 ) -> dict[str, Any]:
     """Execute script content and return results.
 
@@ -716,6 +1107,11 @@ def execute_script_content(
         env_vars: Environment variables to set (e.g., {"UNITYSVC_API_KEY": "...", "SERVICE_BASE_URL": "..."})
         output_contains: Optional substring that must appear in stdout for success
         timeout: Execution timeout in seconds (default: 30)
+        settle_timeout: If set, stop the script once output_contains has appeared
+            and it has printed nothing for this many seconds, and treat it as
+            successful (default: wait for the script to exit)
+        base_env: Environment that env_vars are layered on (default: os.environ).
+            Callers running many scripts can snapshot os.environ once and pass it here.
 
     Returns:
         Result dictionary with:
@@ -725,9 +1121,6 @@ def execute_script_content(
         - stdout: Standard output (truncated to 1KB)
         - stderr: Standard error (truncated to 1KB)
     """
-    import subprocess
-    import tempfile
-
     # Output truncation limit (10KB — must be large enough to capture
     # full Python tracebacks including HTTP error bodies)
     MAX_OUTPUT_SIZE = 10_000
@@ -749,41 +1142,51 @@ def execute_script_content(
 
     assert interpreter_cmd is not None, "interpreter_cmd should not be None after error check"
 
-    # Prepare environment
-    env = os.environ.copy()
-    env.update(env_vars)
+    # Prepare environment (one merged dict rather than a copy plus updates)
+    env = {**(os.environ if base_env is None else base_env), **env_vars}
 
-    # Write script to temporary file
     temp_file = None
+    script_fd = None
+    pass_fds: tuple[int, ...] = ()
     try:
-        temp_file = tempfile.NamedTemporaryFile(
-            mode="w",
-            suffix=file_suffix,
-            delete=False,
-        )
-        temp_file.write(script)
-        temp_file.close()
-        os.chmod(temp_file.name, 0o755)
+        stdin_args = _STDIN_SCRIPT_ARGS.get(interpreter_cmd)
+        if stdin_args is not None:
+            # Interpreter reads the whole script from stdin before running it,
+            # so there is no need for a round-trip through a temporary file
+            cmd = [interpreter_cmd, *stdin_args]
+            script_input: str | None = script
+        elif (script_fd := _script_memfd(script)) is not None:
+            # Hand the script over as an in-memory file instead of a disk file
+            cmd = [interpreter_cmd, f"/dev/fd/{script_fd}"]
+            pass_fds = (script_fd,)
+            script_input = None
+        else:
+            # Write script to temporary file
+            temp_file = tempfile.NamedTemporaryFile(
+                mode="w",
+                suffix=file_suffix,
+                delete=False,
+            )
+            temp_file.write(script)
+            temp_file.close()
+            os.chmod(temp_file.name, 0o755)
+            cmd = [interpreter_cmd, temp_file.name]
+            script_input = None
 
         # Execute script
-        process = subprocess.run(
-            [interpreter_cmd, temp_file.name],
-            env=env,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
+        returncode, stdout, stderr, found = _run_with_bounded_output(
+            cmd, script_input, env, timeout, MAX_OUTPUT_SIZE, output_contains, settle_timeout, pass_fds
         )
 
-        result["exit_code"] = process.returncode
-        result["stdout"] = process.stdout[:MAX_OUTPUT_SIZE] if process.stdout else None
-        # Keep the tail of stderr — the actual error message is at the bottom
-        result["stderr"] = process.stderr[-MAX_OUTPUT_SIZE:] if process.stderr else None
+        result["exit_code"] = returncode
+        result["stdout"] = stdout or None
+        result["stderr"] = stderr or None
 
         # Determine status
-        if process.returncode != 0:
+        if returncode != 0:
             result["status"] = "script_failed"
-            result["error"] = f"Script exited with code {process.returncode}"
-        elif output_contains and (not process.stdout or output_contains.lower() not in process.stdout.lower()):
+            result["error"] = f"Script exited with code {returncode}"
+        elif not found:
             result["status"] = "unexpected_output"
             result["error"] = f"Output does not contain: {output_contains}"
         else:
@@ -797,12 +1200,20 @@ def execute_script_content(
     except Exception as e:
         result["error"] = str(e)
     finally:
+        if script_fd is not None:
+            os.close(script_fd)
         if temp_file and os.path.exists(temp_file.name):
             os.unlink(temp_file.name)
 
     return result
 
 
+@lru_cache(maxsize=32)
+def _which(cmd: str) -> str | None:
+    """Cached ``shutil.which``; PATH does not change during a CLI invocation."""
+    return shutil.which(cmd)
+
+
 def determine_interpreter(script: str, mime_type: str) -> tuple[str | None, str, str | None]:
     """
     Determine the interpreter command for executing a script.
@@ -827,58 +1238,49 @@ def determine_interpreter(script: str, mime_type: str) -> tuple[str | None, str,
         >>> determine_interpreter("curl http://example.com", "bash")
         ('bash', '.sh', None)
     """
-    import shutil
+    # Only the first line (shebang) matters, so avoid splitting the whole script
+    first_line = script.partition("\n")[0]
+    # Scripts without a shebang all share one cache entry per MIME type
+    shebang_line = first_line if first_line.startswith("#!") else ""
+    return _resolve_interpreter(shebang_line, mime_type)
 
-    # Map MIME type to file suffix
-    mime_to_suffix = {
-        "python": ".py",
-        "javascript": ".js",
-        "bash": ".sh",
-    }
 
-    file_suffix = mime_to_suffix.get(mime_type, "")
-    if not file_suffix:
-        return None, "", f"Unsupported MIME type: {mime_type}. Supported: python, javascript, bash"
+# MIME type -> (file suffix, interpreters to try in order, error if none is found)
+_MIME_INTERPRETERS: dict[str, tuple[str, tuple[str, ...], str]] = {
+    "python": (".py", ("python3", "python"), "Neither 'python3' nor 'python' found."),
+    "javascript": (".js", ("node",), "'node' not found. Please install Node.js."),
+    "bash": (".sh", ("bash",), "'bash' not found."),
+}
+
 
-    # Parse shebang to get interpreter
-    lines = script.split("\n")
-    interpreter_cmd = None
+@lru_cache(maxsize=64)
+def _resolve_interpreter(first_line: str, mime_type: str) -> tuple[str | None, str, str | None]:
+    """Resolve the interpreter from a script's shebang line (or "") and MIME type.
 
-    # First, try to parse shebang
-    if lines and lines[0].startswith("#!"):
-        shebang = lines[0][2:].strip()
+    Cached because many examples share the same shebang (or have none) and
+    MIME type; see ``determine_interpreter`` for the return value.
+    """
+    spec = _MIME_INTERPRETERS.get(mime_type)
+    if spec is None:
+        return None, "", f"Unsupported MIME type: {mime_type}. Supported: python, javascript, bash"
+    file_suffix, candidates, missing_error = spec
+
+    # Shebang wins; verify the interpreter it names exists
+    if first_line.startswith("#!"):
+        shebang = first_line[2:].strip()
         if "/env " in shebang:
             # e.g., #!/usr/bin/env python3
             interpreter_cmd = shebang.split("/env ", 1)[1].strip().split()[0]
         else:
             # e.g., #!/usr/bin/python3
             interpreter_cmd = shebang.split("/")[-1].split()[0]
-
-    # If no shebang found, determine interpreter based on MIME type
-    if not interpreter_cmd:
-        if mime_type == "python":
-            # Try python3 first, fallback to python
-            if shutil.which("python3"):
-                interpreter_cmd = "python3"
-            elif shutil.which("python"):
-                interpreter_cmd = "python"
-            else:
-                return None, file_suffix, "Neither 'python3' nor 'python' found."
-        elif mime_type == "javascript":
-            # JavaScript files need Node.js
-            if shutil.which("node"):
-                interpreter_cmd = "node"
-            else:
-                return None, file_suffix, "'node' not found. Please install Node.js."
-        elif mime_type == "bash":
-            # Shell scripts use bash
-            if shutil.which("bash"):
-                interpreter_cmd = "bash"
-            else:
-                return None, file_suffix, "'bash' not found."
-    else:
-        # Shebang was found - verify the interpreter exists
-        if not shutil.which(interpreter_cmd):
+        if not _which(interpreter_cmd):
             return None, file_suffix, f"Interpreter '{interpreter_cmd}' from shebang not found."
+        return interpreter_cmd, file_suffix, None
+
+    # No shebang: take the first available interpreter for the MIME type
+    available_cmd = next((cmd for cmd in candidates if _which(cmd)), None)
+    if available_cmd is None:
+        return None, file_suffix, missing_error
 
-    return interpreter_cmd, file_suffix, None
+    return available_cmd, file_suffix, None
@@ -0,0 +1,225 @@
+"""Tests for local code example discovery."""
+
+from pathlib import Path
+
+import pytest
+
+from unitysvc_services.example import discover_code_examples
+
+
+@pytest.fixture
+def example_data_dir() -> Path:
+    """Return the example data directory."""
+    return Path(__file__).parent / "example_data"
+
+
+def test_discover_code_examples_all(example_data_dir: Path) -> None:
+    """Test that testable documents from every listing are discovered."""
+    examples = discover_code_examples(example_data_dir)
+
+    found = {(ex["service_name"], ex["title"], prov) for ex, prov in examples}
+    assert ("service1", "Python Code Example", "provider1") in found
+    assert ("service1", "Connectivity Test", "provider1") in found
+    assert all(ex["upstream_interface_name"] for ex, _prov in examples)
+
+
+def test_discover_code_examples_service_patterns(example_data_dir: Path) -> None:
+    """Test that multiple wildcard service patterns are combined."""
+    only_one = discover_code_examples(example_data_dir, service_patterns=["*1"])
+    both = discover_code_examples(example_data_dir, service_patterns=["service1", "serv*2"])
+    none = discover_code_examples(example_data_dir, service_patterns=["service"])
+
+    assert {ex["service_name"] for ex, _prov in only_one} == {"service1"}
+    assert {ex["service_name"] for ex, _prov in both} == {"service1", "service2"}
+    assert none == []
+
+
+def test_discover_code_examples_provider_filter(example_data_dir: Path) -> None:
+    """Test that the provider filter only returns examples from that provider."""
+    examples = discover_code_examples(example_data_dir, provider_name="provider2")
+
+    assert examples
+    assert {prov for _ex, prov in examples} == {"provider2"}
+    assert discover_code_examples(example_data_dir, provider_name="missing") == []
+
+
+def test_discover_code_examples_test_file_filter(example_data_dir: Path) -> None:
+    """Test that the test file filter keeps only examples whose path ends with it."""
+    examples = discover_code_examples(example_data_dir, test_file="connectivity.sh")
+
+    assert examples
+    assert all(ex["file_path"].endswith("connectivity.sh") for ex, _prov in examples)
+    assert discover_code_examples(example_data_dir, test_file="missing.py") == []
+
+
+def test_save_output_files_roundtrip(tmp_path: Path) -> None:
+    """Test that saved results are detected as passing only when they passed."""
+    from unitysvc_services.example import has_passing_output_files, save_output_files
+
+    listing_file = tmp_path / "listing.json"
+    code_example = tmp_path / "code-example.py.j2"
+
+    assert not has_passing_output_files(code_example, listing_file)
+
+    out_path, err_path = save_output_files(code_example, listing_file, "ok\n", "", passed=True)
+    assert out_path.name == "listing_code-example.py.out"
+    assert out_path.read_text() == "ok\n"
+    assert err_path.read_text() == ""
+    assert has_passing_output_files(code_example, listing_file)
+
+    save_output_files(code_example, listing_file, "", "boom", passed=False)
+    assert not has_passing_output_files(code_example, listing_file)
+
+
+def test_execution_key_shared_script() -> None:
+    """Plain scripts with identical inputs share a key; templates never do."""
+    from unitysvc_services.example import _execution_key
+
+    example = {"file_path": "/data/p/services/s/test.sh", "mime_type": "bash", "output_contains": "ok"}
+    creds = {"api_key": "k", "base_url": "https://api.example.com"}
+
+    assert _execution_key(example, creds) == _execution_key(dict(example), dict(creds))
+    assert _execution_key(example, creds) != _execution_key(example, {**creds, "api_key": "other"})
+    assert _execution_key({**example, "file_path": "/data/p/services/s/test.py.j2"}, creds) is None
+
+
+def _write_run_tree(root: Path) -> Path:
+    """Create a small data tree with two services, each with a passing and a failing script."""
+    import json
+
+    data_dir = root / "data"
+    provider_dir = data_dir / "provider1"
+    provider_dir.mkdir(parents=True)
+    (provider_dir / "provider.json").write_text(json.dumps({"schema": "provider_v1", "name": "provider1"}))
+
+    for service in ("svc-a", "svc-b"):
+        service_dir = provider_dir / "services" / service
+        service_dir.mkdir(parents=True)
+        (service_dir / "offering.json").write_text(
+            json.dumps(
+                {
+                    "schema": "offering_v1",
+                    "name": service,
+                    "upstream_access_config": {"Upstream API": {"base_url": "https://api.example.com"}},
+                }
+            )
+        )
+        (service_dir / "listing.json").write_text(
+            json.dumps(
+                {
+                    "schema": "listing_v1",
+                    "documents": {
+                        "Passing Test": {
+                            "mime_type": "python",
+                            "category": "connectivity_test",
+                            "file_path": "pass.py",
+                        },
+                        "Failing Test": {
+                            "mime_type": "python",
+                            "category": "connectivity_test",
+                            "file_path": "fail.py",
+                        },
+                    },
+                }
+            )
+        )
+        (service_dir / "pass.py").write_text(f"print('hello from {service}')\n")
+        (service_dir / "fail.py").write_text("import sys\nprint('broken')\nsys.exit(3)\n")
+
+    return data_dir
+
+
+def _run_tree(root: Path, monkeypatch: pytest.MonkeyPatch, concurrency: int) -> tuple[str, dict[str, str]]:
+    """Run the tree under *root* with ``-j concurrency``; return the summary and the saved artifacts."""
+    import re
+
+    from typer.testing import CliRunner
+
+    from unitysvc_services.example import app
+
+    data_dir = _write_run_tree(root)
+    monkeypatch.chdir(root)
+    result = CliRunner().invoke(app, ["run", str(data_dir), "-j", str(concurrency)])
+    assert result.exit_code == 1, result.output
+
+    output = re.sub(r"\x1b\[[0-9;]*m", "", result.output)
+    assert "\x1b[" not in result.output
+    summary = output[output.index("Test Results Summary") :]
+    artifacts = {
+        str(path.relative_to(root)): path.read_text()
+        for path in sorted(root.rglob("*"))
+        if path.is_file() and (path.suffix in {".out", ".err", ".status", ".env"} or path.name.startswith("failed_"))
+    }
+    return summary, artifacts
+
+
+def test_run_local_concurrency_matches_sequential(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Running with -j 2 produces the same summary and saved outputs as -j 1."""
+    sequential_summary, sequential_artifacts = _run_tree(tmp_path / "seq", monkeypatch, 1)
+    parallel_summary, parallel_artifacts = _run_tree(tmp_path / "par", monkeypatch, 2)
+
+    assert "Passed: 2/4" in sequential_summary
+    assert "Failed: 2/4" in sequential_summary
+    assert parallel_summary == sequential_summary
+    assert parallel_artifacts == sequential_artifacts
+    assert any(name.startswith("failed_") for name in sequential_artifacts)
+
+
+def test_run_local_concurrency_keeps_failing_case_output_together(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Under -j 2, each failing case's warnings stay in its own block and all cases share one enrollment code."""
+    import json
+    import re
+
+    from typer.testing import CliRunner
+
+    from unitysvc_services.example import app
+
+    # No provider file, so rendering each template warns about it
+    data_dir = tmp_path / "data"
+    for service in ("svc-a", "svc-b", "svc-c", "svc-d"):
+        service_dir = data_dir / "provider1" / "services" / service
+        service_dir.mkdir(parents=True)
+        (service_dir / "offering.json").write_text(
+            json.dumps(
+                {
+                    "schema": "offering_v1",
+                    "name": service,
+                    "upstream_access_config": {"Upstream API": {"base_url": "https://api.example.com"}},
+                }
+            )
+        )
+        (service_dir / "listing.json").write_text(
+            json.dumps(
+                {
+                    "schema": "listing_v1",
+                    "service_options": {"enrollment_vars": {"user_code": "{{ enrollment_code() }}"}},
+                    "documents": {
+                        "Template Test": {
+                            "mime_type": "python",
+                            "category": "connectivity_test",
+                            "file_path": "test.py.j2",
+                        },
+                    },
+                }
+            )
+        )
+        (service_dir / "test.py.j2").write_text("import sys\nprint('{{ offering.name }}')\nsys.exit(1)\n")
+
+    monkeypatch.chdir(tmp_path)
+    result = CliRunner().invoke(app, ["run", str(data_dir), "-j", "2"])
+    assert result.exit_code == 1, result.output
+
+    output = re.sub(r"\x1b\[[0-9;]*m", "", result.output)
+    assert "Failed: 4/4" in output
+    blocks = output.split("Testing:")[1:]
+    assert len(blocks) == 4
+    for block in blocks:
+        assert block.count("No provider_v1 file found") == 1
+
+    env_files = sorted(tmp_path.glob("failed_*.env"))
+    assert len(env_files) == 4
+    codes = [code for env in env_files for code in re.findall(r"^USER_CODE=(\w+)$", env.read_text(), re.M)]
+    assert len(codes) == 4
+    assert len(set(codes)) == 1
@@ -1,5 +1,6 @@
 """Tests for utility functions."""
 
+import os
 from pathlib import Path
 
 import pytest
@@ -297,6 +298,17 @@ def test_load_data_file_json_no_override(tmp_path: Path) -> None:
     assert data == base_data
 
 
+def test_load_data_file_json5_syntax(tmp_path: Path) -> None:
+    """Test that JSON files using JSON5 syntax still load."""
+    base_file = tmp_path / "test.json"
+    base_file.write_text('{\n  // comment\n  "name": "test",\n  "tags": ["a", "b",],\n}\n', encoding="utf-8")
+
+    data, file_format = load_data_file(base_file)
+
+    assert file_format == "json"
+    assert data == {"name": "test", "tags": ["a", "b"]}
+
+
 def test_load_data_file_json_with_override(tmp_path: Path) -> None:
     """Test loading JSON file with override."""
     import json
@@ -420,6 +432,19 @@ def test_render_template_file_basic(tmp_path: Path) -> None:
     assert filename == "hello.txt"
 
 
+def test_render_template_file_reuses_template_with_new_context(tmp_path: Path) -> None:
+    """Test that rendering the same template again uses the new context and picks up edits."""
+    template_file = tmp_path / "hello.txt.j2"
+    template_file.write_text("Hello, {{ offering.name }}!")
+
+    first, _ = render_template_file(template_file, offering={"name": "one"})
+    second, _ = render_template_file(template_file, offering={"name": "two"})
+    template_file.write_text("Bye, {{ offering.name }}!")
+    edited, _ = render_template_file(template_file, offering={"name": "two"})
+
+    assert (first, second, edited) == ("Hello, one!", "Hello, two!", "Bye, two!")
+
+
 def test_render_template_file_local_testing_true(tmp_path: Path) -> None:
     """Test that {% if local_testing %} blocks are included when True."""
     template_file = tmp_path / "request.json.j2"
@@ -486,3 +511,453 @@ def test_render_template_file_non_template(tmp_path: Path) -> None:
 
     assert content == "print('{{ not a template }}')"
     assert filename == "script.py"
+
+
+# =============================================================================
+# determine_interpreter tests
+# =============================================================================
+
+
+def test_determine_interpreter_from_shebang() -> None:
+    """Test that the shebang on the first line selects the interpreter."""
+    from unitysvc_services.utils import determine_interpreter
+
+    script = "#!/usr/bin/env python3\n" + "print('x')\n" * 1000
+
+    interpreter_cmd, file_suffix, error = determine_interpreter(script, "python")
+
+    assert interpreter_cmd == "python3"
+    assert file_suffix == ".py"
+    assert error is None
+
+
+def test_determine_interpreter_single_line_shebang() -> None:
+    """Test that a script consisting only of a shebang line is parsed."""
+    from unitysvc_services.utils import determine_interpreter
+
+    interpreter_cmd, _file_suffix, error = determine_interpreter("#!/bin/bash", "bash")
+
+    assert interpreter_cmd == "bash"
+    assert error is None
+
+
+def test_determine_interpreter_unsupported_mime_type() -> None:
+    """Test that unsupported MIME types return an error."""
+    from unitysvc_services.utils import determine_interpreter
+
+    interpreter_cmd, file_suffix, error = determine_interpreter("puts 'hi'", "ruby")
+
+    assert interpreter_cmd is None
+    assert file_suffix == ""
+    assert error is not None and "Unsupported MIME type" in error
+
+
+# =============================================================================
+# execute_script_content tests
+# =============================================================================
+
+
+def test_execute_script_content_python_success() -> None:
+    """Test that a python script runs and its stdout is captured."""
+    from unitysvc_services.utils import execute_script_content
+
+    result = execute_script_content(
+        script="import os\nprint('hello', os.environ['SERVICE_BASE_URL'])\n",
+        mime_type="python",
+        env_vars={"SERVICE_BASE_URL": "https://example.com"},
+    )
+
+    assert result["status"] == "success"
+    assert result["exit_code"] == 0
+    assert result["stdout"].strip() == "hello https://example.com"
+
+
+def test_execute_script_content_python_sees_eof_on_stdin() -> None:
+    """Test that a script reading stdin gets EOF rather than its own source."""
+    from unitysvc_services.utils import execute_script_content
+
+    result = execute_script_content(
+        script="import sys\nprint(repr(sys.stdin.read()))\n",
+        mime_type="python",
+        env_vars={},
+    )
+
+    assert result["status"] == "success"
+    assert result["stdout"].strip() == "''"
+
+
+def test_execute_script_content_bash_multiline() -> None:
+    """Test that a multi-line bash script runs in full, even if it reads stdin."""
+    from unitysvc_services.utils import execute_script_content
+
+    result = execute_script_content(
+        script='#!/bin/bash\ncat\necho first\necho "$GREETING"\n',
+        mime_type="bash",
+        env_vars={"GREETING": "second"},
+    )
+
+    assert result["status"] == "success"
+    assert result["stdout"].split() == ["first", "second"]
+
+
+def test_execute_script_content_bash_failure() -> None:
+    """Test that a non-zero exit code is reported as script_failed."""
+    from unitysvc_services.utils import execute_script_content
+
+    result = execute_script_content(
+        script="echo oops >&2\nexit 3\n",
+        mime_type="bash",
+        env_vars={},
+    )
+
+    assert result["status"] == "script_failed"
+    assert result["exit_code"] == 3
+    assert "oops" in result["stderr"]
+
+
+def test_execute_script_content_unexpected_output() -> None:
+    """Test that output_contains is checked case-insensitively against stdout."""
+    from unitysvc_services.utils import execute_script_content
+
+    ok = execute_script_content(script="print('Hello World')", mime_type="python", env_vars={}, output_contains="hello")
+    bad = execute_script_content(script="print('Goodbye')", mime_type="python", env_vars={}, output_contains="hello")
+
+    assert ok["status"] == "success"
+    assert bad["status"] == "unexpected_output"
+    assert bad["error"] == "Output does not contain: hello"
+
+
+# =============================================================================
+# find_files_by_schema tests
+# =============================================================================
+
+
+def test_find_files_by_schema_parses_each_file_once(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that querying several schemas over one directory parses each file once."""
+    from unitysvc_services import utils
+
+    (tmp_path / "provider.json").write_text('{"schema": "provider_v1", "name": "p"}')
+    (tmp_path / "seller.json").write_text('{"schema": "seller_v1", "name": "s"}')
+
+    calls: list[Path] = []
+    original = utils.load_data_file
+
+    def counting_load(file_path: Path, *, skip_override: bool = False):
+        calls.append(file_path)
+        return original(file_path, skip_override=skip_override)
+
+    monkeypatch.setattr(utils, "load_data_file", counting_load)
+
+    providers = utils.find_files_by_schema(tmp_path, "provider_v1")
+    sellers = utils.find_files_by_schema(tmp_path, "seller_v1")
+
+    assert [data["name"] for _, _, data in providers] == ["p"]
+    assert [data["name"] for _, _, data in sellers] == ["s"]
+    assert sorted(calls) == sorted([tmp_path / "provider.json", tmp_path / "seller.json"])
+
+    # Returned data is a private copy; mutating it does not leak into the next identical lookup
+    providers[0][2]["name"] = "changed"
+    assert utils.find_files_by_schema(tmp_path, "provider_v1")[0][2]["name"] == "p"
+
+
+def test_iter_files_by_schema_large_tree_parses_once(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the parse cache holds a whole large tree, so a second scan parses nothing."""
+    from unitysvc_services import utils
+
+    for i in range(1500):
+        (tmp_path / f"listing{i}.json").write_text('{"schema": "listing_v1"}')
+
+    calls: list[Path] = []
+    original = utils.load_data_file
+
+    def counting_load(file_path: Path, *, skip_override: bool = False):
+        calls.append(file_path)
+        return original(file_path, skip_override=skip_override)
+
+    monkeypatch.setattr(utils, "load_data_file", counting_load)
+
+    assert len(list(utils.iter_files_by_schema(tmp_path, "listing_v1"))) == 1500
+    assert len(list(utils.iter_files_by_schema(tmp_path, "listing_v1"))) == 1500
+    assert len(calls) == 1500
+
+
+def test_execute_script_content_bounds_large_output() -> None:
+    """Test that large stdout is truncated to its head and matched across chunk boundaries."""
+    from unitysvc_services.utils import execute_script_content
+
+    # The marker straddles the 4 KiB read boundary and is far past the kept head
+    script = (
+        "import sys\nsys.stdout.write('x' * 4094 + 'MARKER' + 'y' * 50000)\nsys.stderr.write('z' * 50000 + 'END')\n"
+    )
+    result = execute_script_content(script=script, mime_type="python", env_vars={}, output_contains="marker")
+
+    assert result["status"] == "success"
+    assert len(result["stdout"]) == 10_000
+    assert result["stdout"].startswith("x" * 4094 + "MARKER")
+    assert len(result["stderr"]) == 10_000
+    assert result["stderr"].endswith("END")
+
+
+def test_execute_script_content_timeout() -> None:
+    """Test that a script running past the timeout is killed and reported."""
+    from unitysvc_services.utils import execute_script_content
+
+    result = execute_script_content(script="import time\ntime.sleep(10)\n", mime_type="python", env_vars={}, timeout=1)
+
+    assert result["status"] == "task_failed"
+    assert result["error"] == "Script execution timeout (1 seconds)"
+
+
+def test_find_files_by_schema_non_recursive(tmp_path: Path) -> None:
+    """Test that recursive=False only considers files directly in the directory."""
+    from unitysvc_services.utils import find_files_by_schema
+
+    (tmp_path / "provider.json").write_text('{"schema": "provider_v1", "name": "top"}')
+    nested = tmp_path / "services" / "svc"
+    nested.mkdir(parents=True)
+    (nested / "provider.json").write_text('{"schema": "provider_v1", "name": "nested"}')
+
+    assert len(find_files_by_schema(tmp_path, "provider_v1")) == 2
+    results = find_files_by_schema(tmp_path, "provider_v1", recursive=False)
+    assert [data["name"] for _, _, data in results] == ["top"]
+
+
+def test_find_files_by_schema_skips_unrelated_files(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that files not mentioning the schema are not parsed unless an override may set it."""
+    from unitysvc_services import utils
+
+    (tmp_path / "listing.json").write_text('{"schema": "listing_v1"}')
+    (tmp_path / "broken.json").write_text("{ not valid json")
+    (tmp_path / "offering.json").write_text('{"name": "from-base"}')
+    (tmp_path / "offering.override.json").write_text('{"schema": "offering_v1"}')
+
+    parsed: list[str] = []
+    original = utils.load_data_file
+
+    def tracking_load(file_path: Path, *, skip_override: bool = False):
+        parsed.append(file_path.name)
+        return original(file_path, skip_override=skip_override)
+
+    monkeypatch.setattr(utils, "load_data_file", tracking_load)
+
+    results = utils.find_files_by_schema(tmp_path, "offering_v1")
+
+    assert tmp_path / "offering.json" in [path for path, _, _ in results]
+    assert "listing.json" not in parsed
+    assert "broken.json" not in parsed
+
+
+def test_iter_files_by_schema_filters_paths_before_parsing(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that files rejected by the path filter are never parsed."""
+    from unitysvc_services import utils
+
+    for svc in ("keep", "skip"):
+        (tmp_path / svc).mkdir()
+        (tmp_path / svc / "listing.json").write_text(f'{{"schema": "listing_v1", "name": "{svc}"}}')
+
+    parsed: list[str] = []
+    original = utils.load_data_file
+
+    def tracking_load(file_path: Path, *, skip_override: bool = False):
+        parsed.append(file_path.parent.name)
+        return original(file_path, skip_override=skip_override)
+
+    monkeypatch.setattr(utils, "load_data_file", tracking_load)
+
+    results = list(utils.iter_files_by_schema(tmp_path, "listing_v1", path_filter=lambda p: p.parent.name == "keep"))
+
+    assert [data["name"] for _, _, data in results] == ["keep"]
+    assert parsed == ["keep"]
+
+
+def test_find_files_by_schema_skips_non_object_files(tmp_path: Path) -> None:
+    """Test that a data file whose top level is not an object is skipped, not fatal."""
+    from unitysvc_services.utils import find_files_by_schema
+
+    (tmp_path / "listing.json").write_text('{"schema": "listing_v1"}')
+    (tmp_path / "array.json").write_text('["listing_v1"]')
+
+    results = find_files_by_schema(tmp_path, "listing_v1")
+
+    assert [path.name for path, _, _ in results] == ["listing.json"]
+
+
+def test_execute_script_content_settle_timeout() -> None:
+    """Test that a script is stopped once its expected output appeared and it went quiet."""
+    import time
+
+    from unitysvc_services.utils import execute_script_content
+
+    script = "import time\nprint('ready', flush=True)\ntime.sleep(20)\n"
+    start = time.monotonic()
+    result = execute_script_content(
+        script=script, mime_type="python", env_vars={}, output_contains="READY", timeout=15, settle_timeout=0.5
+    )
+
+    assert time.monotonic() - start < 10
+    assert result["status"] == "success"
+    assert result["exit_code"] == 0
+    assert result["stdout"].strip() == "ready"
+
+
+def test_find_data_files_skips_hidden_and_package_dirs(tmp_path: Path) -> None:
+    """Test that hidden directories and node_modules are not searched for data files."""
+    from unitysvc_services.utils import find_data_files
+
+    for rel in ("provider.json", "services/svc/listing.toml", ".git/config.json", "node_modules/pkg/package.json"):
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("{}")
+
+    found = {p.relative_to(tmp_path).as_posix() for p in find_data_files(tmp_path)}
+
+    assert found == {"provider.json", "services/svc/listing.toml"}
+
+
+def test_execute_script_content_uses_base_env() -> None:
+    """Test that env_vars are layered on the given base environment instead of os.environ."""
+    from unitysvc_services.utils import execute_script_content
+
+    script = "import os\nprint(os.environ.get('FROM_BASE'), os.environ.get('FROM_VARS'))\n"
+    result = execute_script_content(
+        script=script,
+        mime_type="python",
+        env_vars={"FROM_VARS": "vars"},
+        base_env={"PATH": os.environ.get("PATH", ""), "FROM_BASE": "base"},
+    )
+
+    assert result["status"] == "success"
+    assert result["stdout"].strip() == "base vars"
+
+
+def test_find_file_by_schema_and_name_rereads_changed_files(tmp_path: Path) -> None:
+    """Test that the parse cache picks up a data file edited after it was first read."""
+    from unitysvc_services.utils import find_file_by_schema_and_name
+
+    provider_file = tmp_path / "provider.json"
+    provider_file.write_text('{"schema": "provider_v1", "name": "acme", "display_name": "Old"}')
+    first = find_file_by_schema_and_name(tmp_path, "provider_v1", "name", "acme")
+
+    provider_file.write_text('{"schema": "provider_v1", "name": "acme", "display_name": "New name"}')
+    second = find_file_by_schema_and_name(tmp_path, "provider_v1", "name", "acme")
+
+    assert first is not None and first[2]["display_name"] == "Old"
+    assert second is not None and second[2]["display_name"] == "New name"
+
+
+def test_find_file_by_schema_and_name_rereads_same_size_edit_with_same_mtime(tmp_path: Path) -> None:
+    """Test that a same-size edit is re-read even when the modification time is unchanged."""
+    import time
+
+    from unitysvc_services.utils import find_file_by_schema_and_name
+
+    provider_file = tmp_path / "provider.json"
+    provider_file.write_text('{"schema": "provider_v1", "name": "acme", "display_name": "Old"}')
+    mtime_ns = provider_file.stat().st_mtime_ns
+    first = find_file_by_schema_and_name(tmp_path, "provider_v1", "name", "acme")
+
+    # Simulate coarse timestamps: same size, modification time restored
+    time.sleep(0.01)
+    provider_file.write_text('{"schema": "provider_v1", "name": "acme", "display_name": "New"}')
+    os.utime(provider_file, ns=(mtime_ns, mtime_ns))
+    second = find_file_by_schema_and_name(tmp_path, "provider_v1", "name", "acme")
+
+    assert first is not None and first[2]["display_name"] == "Old"
+    assert second is not None and second[2]["display_name"] == "New"
+
+
+def test_write_env_file_is_owner_only(tmp_path: Path) -> None:
+    """Test that .env files are written as KEY=value lines readable only by the owner."""
+    from unitysvc_services.utils import write_env_file
+
+    env_file = tmp_path / "failed.env"
+    env_file.write_text("stale")
+    env_file.chmod(0o644)
+
+    write_env_file(env_file, {"UNITYSVC_API_KEY": "secret", "SERVICE_BASE_URL": "https://api.example.com"})
+
+    assert env_file.read_text() == "UNITYSVC_API_KEY=secret\nSERVICE_BASE_URL=https://api.example.com\n"
+    assert env_file.stat().st_mode & 0o777 == 0o600
+
+
+def test_find_files_by_schema_sees_new_override(tmp_path: Path) -> None:
+    """Test that writing an override invalidates cached schema lookups."""
+    from unitysvc_services.utils import find_files_by_schema, write_override_file
+
+    listing_file = tmp_path / "listing.json"
+    listing_file.write_text('{"schema": "listing_v1", "name": "svc"}')
+    assert "service_id" not in find_files_by_schema(tmp_path, "listing_v1")[0][2]
+
+    write_override_file(listing_file, {"service_id": "abc-123"})
+
+    assert find_files_by_schema(tmp_path, "listing_v1")[0][2]["service_id"] == "abc-123"
+
+
+def test_find_files_by_schema_sees_edited_override_without_rescan(tmp_path: Path) -> None:
+    """Test that editing an existing override is picked up without re-walking the directory."""
+    from unitysvc_services.utils import find_data_files, find_files_by_schema, write_override_file
+
+    listing_file = tmp_path / "listing.json"
+    listing_file.write_text('{"schema": "listing_v1", "name": "svc"}')
+    write_override_file(listing_file, {"service_id": "old"})
+    assert find_files_by_schema(tmp_path, "listing_v1")[0][2]["service_id"] == "old"
+
+    walks = find_data_files.cache_info().misses
+    write_override_file(listing_file, {"service_id": "new-service-id"})
+
+    assert find_files_by_schema(tmp_path, "listing_v1")[0][2]["service_id"] == "new-service-id"
+    assert find_data_files.cache_info().misses == walks
+
+
+def test_find_files_by_schema_repeated_lookups_stat_only_matches(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that repeating a lookup stats the files it returns, not the whole tree."""
+    from unitysvc_services import utils
+
+    (tmp_path / "provider.json").write_text('{"schema": "provider_v1", "name": "p"}')
+    for i in range(20):
+        service_dir = tmp_path / "services" / f"svc{i}"
+        service_dir.mkdir(parents=True)
+        (service_dir / "offering.json").write_text('{"schema": "offering_v1"}')
+        (service_dir / "listing.json").write_text('{"schema": "listing_v1"}')
+    utils.find_files_by_schema(tmp_path, "provider_v1")
+
+    stamps: list[Path] = []
+    original = utils._file_stamp
+
+    def counting_stamp(path: Path):
+        stamps.append(path)
+        return original(path)
+
+    monkeypatch.setattr(utils, "_file_stamp", counting_stamp)
+
+    for _ in range(10):
+        assert [path.name for path, _, _ in utils.find_files_by_schema(tmp_path, "provider_v1")] == ["provider.json"]
+
+    # One stamp for the provider file and one for its (missing) override, per lookup
+    assert len(stamps) == 10 * 2
+    assert {path.parent for path in stamps} == {tmp_path}
+
+
+def test_execute_script_content_normalizes_newlines() -> None:
+    """Test that CRLF and CR line endings in script output are normalized to LF."""
+    from unitysvc_services.utils import execute_script_content
+
+    script = "import sys\nsys.stdout.buffer.write(b'one\\r\\ntwo\\rthree\\n')\n"
+    result = execute_script_content(script=script, mime_type="python", env_vars={})
+
+    assert result["stdout"] == "one\ntwo\nthree\n"
+
+
+def test_execute_script_content_without_selectable_pipes(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the communicate() fallback used where pipes cannot be selected on (Windows)."""
+    from unitysvc_services import utils
+
+    monkeypatch.setattr(utils, "_PIPES_SELECTABLE", False)
+    script = "import sys\nprint('x' * 20000 + 'MARKER')\nsys.stderr.write('y' * 20000 + 'END')\n"
+    result = utils.execute_script_content(script=script, mime_type="python", env_vars={}, output_contains="marker")
+
+    assert result["status"] == "success"
+    assert len(result["stdout"]) == 10_000
+    assert result["stderr"].endswith("END")